@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
 import datetime
 import os
 from unittest import mock
@@ -25,15 +26,24 @@ from google.auth import environment_vars
 from google.auth import exceptions
 from google.oauth2 import _client
 
+# Precomputed offsets from "now" used when setting token expiry, so each
+# refresh only performs a single datetime addition.
+_REFRESH_PLUS_5 = _helpers.REFRESH_THRESHOLD + datetime.timedelta(seconds=5)
+_REFRESH_MINUS_1 = _helpers.REFRESH_THRESHOLD - datetime.timedelta(seconds=1)
+_FROZEN_NOW = datetime.datetime(2024, 1, 1)
+
+
+@pytest.fixture(autouse=True)
+def frozen_now(monkeypatch):
+    """Pins _helpers.utcnow() so expiry checks are deterministic."""
+    monkeypatch.setattr(_helpers, "utcnow", lambda: _FROZEN_NOW)
+    return _FROZEN_NOW
+
 
 class CredentialsImpl(credentials.CredentialsWithTrustBoundary):
     def _refresh_token(self, request):
         self.token = "refreshed-token"
-        self.expiry = (
-            datetime.datetime.utcnow()
-            + _helpers.REFRESH_THRESHOLD
-            + datetime.timedelta(seconds=5)
-        )
+        self.expiry = _helpers.utcnow() + _REFRESH_PLUS_5
 
     def with_quota_project(self, quota_project_id):
         raise NotImplementedError()
@@ -43,6 +53,36 @@ class CredentialsImpl(credentials.CredentialsWithTrustBoundary):
         return "http://mock.url/lookup_for_{}".format(self.token)
 
 
+# Constructed once; the ``creds`` fixture hands out shallow copies of it so
+# individual tests don't pay for the full ``__init__`` chain.
+_PROTOTYPE = CredentialsImpl()
+
+
+@pytest.fixture
+def creds():
+    clone = copy.copy(_PROTOTYPE)
+    # The refresh worker is mutated in place by non-blocking refreshes, so
+    # each clone needs its own.
+    clone._refresh_worker = copy.copy(_PROTOTYPE._refresh_worker)
+    return clone
+
+
+class _StubWorker(object):
+    """Minimal stand-in for a RefreshThreadManager that is never started."""
+
+    __slots__ = ("_worker", "_error_info")
+
+    def __init__(self):
+        self._worker = None
+        self._error_info = None
+
+
+class _StubInnerWorker(object):
+    """Minimal stand-in for a RefreshThread that has already failed."""
+
+    __slots__ = ("_error_info",)
+
+
 class CredentialsImplWithMetrics(credentials.Credentials):
     def refresh(self, request):
         self.token = request
@@ -51,60 +91,55 @@ class CredentialsImplWithMetrics(credentials.Credentials):
         return "foo"
 
 
-def test_credentials_constructor():
-    credentials = CredentialsImpl()
-    assert not credentials.token
-    assert not credentials.expiry
-    assert not credentials.expired
-    assert not credentials.valid
-    assert credentials.universe_domain == "googleapis.com"
-    assert not credentials._use_non_blocking_refresh
+def test_credentials_constructor(creds):
+    assert not creds.token
+    assert not creds.expiry
+    assert not creds.expired
+    assert not creds.valid
+    assert creds.universe_domain == "googleapis.com"
+    assert not creds._use_non_blocking_refresh
 
 
-def test_credentials_get_cred_info():
-    credentials = CredentialsImpl()
-    assert not credentials.get_cred_info()
+def test_credentials_get_cred_info(creds):
+    assert not creds.get_cred_info()
 
 
-def test_with_non_blocking_refresh():
-    c = CredentialsImpl()
-    c.with_non_blocking_refresh()
-    assert c._use_non_blocking_refresh
+def test_with_non_blocking_refresh(creds):
+    creds.with_non_blocking_refresh()
+    assert creds._use_non_blocking_refresh
 
 
-def test_expired_and_valid():
-    credentials = CredentialsImpl()
-    credentials.token = "token"
+def test_expired_and_valid(creds):
+    creds.token = "token"
 
-    assert credentials.valid
-    assert not credentials.expired
+    assert creds.valid
+    assert not creds.expired
 
     # Set the expiration to one second more than now plus the clock skew
     # accomodation. These credentials should be valid.
-    credentials.expiry = (
+    creds.expiry = (
         _helpers.utcnow() + _helpers.REFRESH_THRESHOLD + datetime.timedelta(seconds=1)
     )
 
-    assert credentials.valid
-    assert not credentials.expired
+    assert creds.valid
+    assert not creds.expired
 
     # Set the credentials expiration to now. Because of the clock skew
     # accomodation, these credentials should report as expired.
-    credentials.expiry = _helpers.utcnow()
+    creds.expiry = _helpers.utcnow()
 
-    assert not credentials.valid
-    assert credentials.expired
+    assert not creds.valid
+    assert creds.expired
 
 
-def test_before_request():
-    credentials = CredentialsImpl()
+def test_before_request(creds):
     request = mock.Mock()
     headers = {}
 
     # First call should call refresh, setting the token.
-    credentials.before_request(request, "http://example.com", "GET", headers)
-    assert credentials.valid
-    assert credentials.token == "refreshed-token"
+    creds.before_request(request, "http://example.com", "GET", headers)
+    assert creds.valid
+    assert creds.token == "refreshed-token"
     assert headers["authorization"] == "Bearer refreshed-token"
     assert "x-allowed-locations" not in headers
 
@@ -112,24 +147,23 @@ def test_before_request():
     headers = {}
 
     # Second call shouldn't call refresh.
-    credentials.before_request(request, "http://example.com", "GET", headers)
-    assert credentials.valid
-    assert credentials.token == "refreshed-token"
+    creds.before_request(request, "http://example.com", "GET", headers)
+    assert creds.valid
+    assert creds.token == "refreshed-token"
     assert headers["authorization"] == "Bearer refreshed-token"
     assert "x-allowed-locations" not in headers
 
 
-def test_before_request_with_trust_boundary():
+def test_before_request_with_trust_boundary(creds):
     DUMMY_BOUNDARY = "0xA30"
-    credentials = CredentialsImpl()
-    credentials._trust_boundary = {"locations": [], "encodedLocations": DUMMY_BOUNDARY}
+    creds._trust_boundary = {"locations": [], "encodedLocations": DUMMY_BOUNDARY}
     request = mock.Mock()
     headers = {}
 
     # First call should call refresh, setting the token.
-    credentials.before_request(request, "http://example.com", "GET", headers)
-    assert credentials.valid
-    assert credentials.token == "refreshed-token"
+    creds.before_request(request, "http://example.com", "GET", headers)
+    assert creds.valid
+    assert creds.token == "refreshed-token"
     assert headers["authorization"] == "Bearer refreshed-token"
     assert headers["x-allowed-locations"] == DUMMY_BOUNDARY
 
@@ -137,9 +171,9 @@ def test_before_request_with_trust_boundary():
     headers = {}
 
     # Second call shouldn't call refresh.
-    credentials.before_request(request, "http://example.com", "GET", headers)
-    assert credentials.valid
-    assert credentials.token == "refreshed-token"
+    creds.before_request(request, "http://example.com", "GET", headers)
+    assert creds.valid
+    assert creds.token == "refreshed-token"
     assert headers["authorization"] == "Bearer refreshed-token"
     assert headers["x-allowed-locations"] == DUMMY_BOUNDARY
 
@@ -252,124 +286,71 @@ def test_create_scoped_if_required_scoped():
     assert scoped_credentials.has_scopes(["one", "two"])
 
 
-def test_create_scoped_if_required_not_scopes():
-    unscoped_credentials = CredentialsImpl()
-    scoped_credentials = credentials.with_scopes_if_required(
-        unscoped_credentials, ["one", "two"]
-    )
-
-    assert scoped_credentials is unscoped_credentials
-
-
-def test_nonblocking_refresh_fresh_credentials():
-    c = CredentialsImpl()
+def test_create_scoped_if_required_not_scopes(creds):
+    scoped_credentials = credentials.with_scopes_if_required(creds, ["one", "two"])
 
-    c._refresh_worker = mock.MagicMock()
-
-    request = mock.Mock()
-
-    c.refresh(request)
-    assert c.token_state == credentials.TokenState.FRESH
-
-    c.with_non_blocking_refresh()
-    c.before_request(request, "http://example.com", "GET", {})
+    assert scoped_credentials is creds
 
 
-def test_nonblocking_refresh_invalid_credentials():
-    c = CredentialsImpl()
-    c.with_non_blocking_refresh()
+def test_nonblocking_refresh_fresh_credentials(creds):
+    creds._refresh_worker = _StubWorker()
 
     request = mock.Mock()
-    headers = {}
 
-    assert c.token_state == credentials.TokenState.INVALID
+    creds.refresh(request)
+    assert creds.token_state == credentials.TokenState.FRESH
 
-    c.before_request(request, "http://example.com", "GET", headers)
-    assert c.token_state == credentials.TokenState.FRESH
-    assert c.valid
-    assert c.token == "refreshed-token"
-    assert headers["authorization"] == "Bearer refreshed-token"
-    assert "x-identity-trust-boundary" not in headers
+    creds.with_non_blocking_refresh()
+    creds.before_request(request, "http://example.com", "GET", {})
 
 
-def test_nonblocking_refresh_stale_credentials():
-    c = CredentialsImpl()
-    c.with_non_blocking_refresh()
+@pytest.mark.parametrize("scenario", ["invalid", "stale", "failed"])
+def test_nonblocking_refresh(scenario, creds):
+    creds.with_non_blocking_refresh()
 
     request = mock.Mock()
     headers = {}
 
-    # Invalid credentials MUST require a blocking refresh.
-    c.before_request(request, "http://example.com", "GET", headers)
-    assert c.token_state == credentials.TokenState.FRESH
-    assert not c._refresh_worker._worker
-
-    c.expiry = (
-        datetime.datetime.utcnow()
-        + _helpers.REFRESH_THRESHOLD
-        - datetime.timedelta(seconds=1)
-    )
-
-    # STALE credentials SHOULD spawn a non-blocking worker
-    assert c.token_state == credentials.TokenState.STALE
-    c.before_request(request, "http://example.com", "GET", headers)
-    assert c._refresh_worker._worker is not None
-
-    assert c.token_state == credentials.TokenState.FRESH
-    assert c.valid
-    assert c.token == "refreshed-token"
+    if scenario == "invalid":
+        assert creds.token_state == credentials.TokenState.INVALID
+    else:
+        # Invalid credentials MUST require a blocking refresh.
+        creds.before_request(request, "http://example.com", "GET", headers)
+        assert creds.token_state == credentials.TokenState.FRESH
+        assert not creds._refresh_worker._worker
+
+        creds.expiry = _helpers.utcnow() + _REFRESH_MINUS_1
+
+        # STALE credentials SHOULD spawn a non-blocking worker
+        assert creds.token_state == credentials.TokenState.STALE
+        if scenario == "failed":
+            creds._refresh_worker._worker = _StubInnerWorker()
+            creds._refresh_worker._worker._error_info = "Some Error"
+
+    creds.before_request(request, "http://example.com", "GET", headers)
+    if scenario != "invalid":
+        assert creds._refresh_worker._worker is not None
+
+    assert creds.token_state == credentials.TokenState.FRESH
+    assert creds.valid
+    assert creds.token == "refreshed-token"
     assert headers["authorization"] == "Bearer refreshed-token"
     assert "x-identity-trust-boundary" not in headers
 
 
-def test_nonblocking_refresh_failed_credentials():
-    c = CredentialsImpl()
-    c.with_non_blocking_refresh()
-
+def test_token_state_no_expiry(creds):
     request = mock.Mock()
-    headers = {}
+    creds.refresh(request)
 
-    # Invalid credentials MUST require a blocking refresh.
-    c.before_request(request, "http://example.com", "GET", headers)
-    assert c.token_state == credentials.TokenState.FRESH
-    assert not c._refresh_worker._worker
-
-    c.expiry = (
-        datetime.datetime.utcnow()
-        + _helpers.REFRESH_THRESHOLD
-        - datetime.timedelta(seconds=1)
-    )
-
-    # STALE credentials SHOULD spawn a non-blocking worker
-    assert c.token_state == credentials.TokenState.STALE
-    c._refresh_worker._worker = mock.MagicMock()
-    c._refresh_worker._worker._error_info = "Some Error"
-    c.before_request(request, "http://example.com", "GET", headers)
-    assert c._refresh_worker._worker is not None
-
-    assert c.token_state == credentials.TokenState.FRESH
-    assert c.valid
-    assert c.token == "refreshed-token"
-    assert headers["authorization"] == "Bearer refreshed-token"
-    assert "x-identity-trust-boundary" not in headers
+    creds.expiry = None
+    assert creds.token_state == credentials.TokenState.FRESH
 
-
-def test_token_state_no_expiry():
-    c = CredentialsImpl()
-
-    request = mock.Mock()
-    c.refresh(request)
-
-    c.expiry = None
-    assert c.token_state == credentials.TokenState.FRESH
-
-    c.before_request(request, "http://example.com", "GET", {})
+    creds.before_request(request, "http://example.com", "GET", {})
 
 
 class TestCredentialsWithTrustBoundary(object):
     @mock.patch.object(_client, "_lookup_trust_boundary")
-    def test_lookup_trust_boundary_env_var_not_true(self, mock_lookup_tb):
-        creds = CredentialsImpl()
+    def test_lookup_trust_boundary_env_var_not_true(self, mock_lookup_tb, creds):
         request = mock.Mock()
 
         # Ensure env var is not "true"
@@ -382,8 +363,7 @@ class TestCredentialsWithTrustBoundary(object):
         mock_lookup_tb.assert_not_called()
 
     @mock.patch.object(_client, "_lookup_trust_boundary")
-    def test_lookup_trust_boundary_env_var_missing(self, mock_lookup_tb):
-        creds = CredentialsImpl()
+    def test_lookup_trust_boundary_env_var_missing(self, mock_lookup_tb, creds):
         request = mock.Mock()
 
         # Ensure env var is missing
@@ -394,8 +374,7 @@ class TestCredentialsWithTrustBoundary(object):
         mock_lookup_tb.assert_not_called()
 
     @mock.patch.object(_client, "_lookup_trust_boundary")
-    def test_lookup_trust_boundary_non_default_universe(self, mock_lookup_tb):
-        creds = CredentialsImpl()
+    def test_lookup_trust_boundary_non_default_universe(self, mock_lookup_tb, creds):
         creds._universe_domain = "my.universe.com"  # Non-GDU
         request = mock.Mock()
 
@@ -408,8 +387,9 @@ class TestCredentialsWithTrustBoundary(object):
         mock_lookup_tb.assert_not_called()
 
     @mock.patch.object(_client, "_lookup_trust_boundary")
-    def test_lookup_trust_boundary_calls_client_and_build_url(self, mock_lookup_tb):
-        creds = CredentialsImpl()
+    def test_lookup_trust_boundary_calls_client_and_build_url(
+        self, mock_lookup_tb, creds
+    ):
         creds.token = "test_token"  # For _build_trust_boundary_lookup_url
         request = mock.Mock()
         expected_url = "http://mock.url/lookup_for_test_token"
@@ -433,8 +413,7 @@ class TestCredentialsWithTrustBoundary(object):
         )
 
     @mock.patch.object(_client, "_lookup_trust_boundary")
-    def test_lookup_trust_boundary_build_url_returns_none(self, mock_lookup_tb):
-        creds = CredentialsImpl()
+    def test_lookup_trust_boundary_build_url_returns_none(self, mock_lookup_tb, creds):
         request = mock.Mock()
 
         # Mock _build_trust_boundary_lookup_url to return None
@@ -457,9 +436,8 @@ class TestCredentialsWithTrustBoundary(object):
     @mock.patch("google.auth._helpers.is_logging_enabled", return_value=True)
     @mock.patch.object(_client, "_lookup_trust_boundary")
     def test_refresh_trust_boundary_fails_with_cached_data_and_logging(
-        self, mock_lookup_tb, mock_is_logging_enabled, mock_logger
+        self, mock_lookup_tb, mock_is_logging_enabled, mock_logger, creds
     ):
-        creds = CredentialsImpl()
         creds._trust_boundary = {"encodedLocations": "0xABC"}
         request = mock.Mock()
 
@@ -12,15 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import base64
 import datetime
 import http.client as http_client
 import json
-import os
+import pathlib
+import re
+import types
 from unittest import mock
 import urllib
 
-from OpenSSL import crypto
 import pytest  # type: ignore
 
 from google.auth import _helpers, external_account
@@ -49,39 +49,48 @@ SERVICE_ACCOUNT_IMPERSONATION_URL = (
 
 QUOTA_PROJECT_ID = "QUOTA_PROJECT_ID"
 SCOPES = ["scope1", "scope2"]
-DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
-SUBJECT_TOKEN_TEXT_FILE = os.path.join(DATA_DIR, "external_subject_token.txt")
-SUBJECT_TOKEN_JSON_FILE = os.path.join(DATA_DIR, "external_subject_token.json")
-TRUST_CHAIN_WITH_LEAF_FILE = os.path.join(DATA_DIR, "trust_chain_with_leaf.pem")
-TRUST_CHAIN_WITHOUT_LEAF_FILE = os.path.join(DATA_DIR, "trust_chain_without_leaf.pem")
-TRUST_CHAIN_WRONG_ORDER_FILE = os.path.join(DATA_DIR, "trust_chain_wrong_order.pem")
-CERT_FILE = os.path.join(DATA_DIR, "public_cert.pem")
-KEY_FILE = os.path.join(DATA_DIR, "privatekey.pem")
-OTHER_CERT_FILE = os.path.join(DATA_DIR, "other_cert.pem")
+DATA_DIR = pathlib.Path(__file__).parent / "data"
+# Paths to the data files are embedded in credential_source configs, some of
+# which get JSON serialized, so they are kept as plain strings.
+SUBJECT_TOKEN_TEXT_FILE = str(DATA_DIR / "external_subject_token.txt")
+SUBJECT_TOKEN_JSON_FILE = str(DATA_DIR / "external_subject_token.json")
+TRUST_CHAIN_WITH_LEAF_FILE = str(DATA_DIR / "trust_chain_with_leaf.pem")
+TRUST_CHAIN_WITHOUT_LEAF_FILE = str(DATA_DIR / "trust_chain_without_leaf.pem")
+TRUST_CHAIN_WRONG_ORDER_FILE = str(DATA_DIR / "trust_chain_wrong_order.pem")
+CERT_FILE = str(DATA_DIR / "public_cert.pem")
+KEY_FILE = str(DATA_DIR / "privatekey.pem")
+OTHER_CERT_FILE = str(DATA_DIR / "other_cert.pem")
 
 SUBJECT_TOKEN_FIELD_NAME = "access_token"
 
-with open(SUBJECT_TOKEN_TEXT_FILE) as fh:
-    TEXT_FILE_SUBJECT_TOKEN = fh.read()
+TEXT_FILE_SUBJECT_TOKEN = pathlib.Path(SUBJECT_TOKEN_TEXT_FILE).read_text()
+JSON_FILE_CONTENT = json.loads(pathlib.Path(SUBJECT_TOKEN_JSON_FILE).read_text())
+JSON_FILE_SUBJECT_TOKEN = JSON_FILE_CONTENT.get(SUBJECT_TOKEN_FIELD_NAME)
+JSON_FILE_CONTENT_BYTES = json.dumps(JSON_FILE_CONTENT).encode("utf-8")
 
-with open(SUBJECT_TOKEN_JSON_FILE) as fh:
-    JSON_FILE_CONTENT = json.load(fh)
-    JSON_FILE_SUBJECT_TOKEN = JSON_FILE_CONTENT.get(SUBJECT_TOKEN_FIELD_NAME)
 
-with open(CERT_FILE, "rb") as f:
-    CERT_FILE_CONTENT = base64.b64encode(
-        crypto.dump_certificate(
-            crypto.FILETYPE_ASN1, crypto.load_certificate(crypto.FILETYPE_PEM, f.read())
-        )
-    ).decode("utf-8")
+_PEM_CERTIFICATE_RE = re.compile(
+    r"-----BEGIN CERTIFICATE-----(.*?)-----END CERTIFICATE-----", re.DOTALL
+)
+
+
+def _pem_body_b64(path):
+    """Returns the base64 encoded DER form of the PEM certificate at path.
+
+    The body of a PEM block already is the base64 encoded DER, so stripping
+    the armor and line breaks is enough; no ASN.1 parsing is needed.
+    """
+    match = _PEM_CERTIFICATE_RE.search(pathlib.Path(path).read_text())
+    return "".join(match.group(1).split())
+
+
+_EXPECTED_CERT_JSON = json.dumps([_pem_body_b64(CERT_FILE)])
+_EXPECTED_CHAIN_JSON = json.dumps(
+    [_pem_body_b64(CERT_FILE), _pem_body_b64(OTHER_CERT_FILE)]
+)
 
-with open(OTHER_CERT_FILE, "rb") as f:
-    OTHER_CERT_FILE_CONTENT = base64.b64encode(
-        crypto.dump_certificate(
-            crypto.FILETYPE_ASN1, crypto.load_certificate(crypto.FILETYPE_PEM, f.read())
-        )
-    ).decode("utf-8")
 
+CREDENTIAL_URL = "http://fakeurl.com"
 TOKEN_URL = "https://sts.googleapis.com/v1/token"
 TOKEN_INFO_URL = "https://sts.googleapis.com/v1/introspect"
 SUBJECT_TOKEN_TYPE = "urn:ietf:params:oauth:token-type:jwt"
@@ -92,7 +101,7 @@ WORKFORCE_AUDIENCE = (
 WORKFORCE_SUBJECT_TOKEN_TYPE = "urn:ietf:params:oauth:token-type:id_token"
 WORKFORCE_POOL_USER_PROJECT = "WORKFORCE_POOL_USER_PROJECT_NUMBER"
 
-VALID_TOKEN_URLS = [
+VALID_TOKEN_URLS = (
     "https://sts.googleapis.com",
     "https://us-east-1.sts.googleapis.com",
     "https://US-EAST-1.sts.googleapis.com",
@@ -102,8 +111,8 @@ VALID_TOKEN_URLS = [
     "https://US-WEST-1-sts.googleapis.com",
     "https://us-west-1-sts.googleapis.com/path?query",
     "https://sts-us-east-1.p.googleapis.com",
-]
-INVALID_TOKEN_URLS = [
+)
+INVALID_TOKEN_URLS = (
     "https://iamcredentials.googleapis.com",
     "sts.googleapis.com",
     "https://",
@@ -132,8 +141,8 @@ INVALID_TOKEN_URLS = [
     "https://sts-xyz.p1.googleapis.com",
     "https://sts-xyz.p.foo.com",
     "https://sts-xyz.p.foo.googleapis.com",
-]
-VALID_SERVICE_ACCOUNT_IMPERSONATION_URLS = [
+)
+VALID_SERVICE_ACCOUNT_IMPERSONATION_URLS = (
     "https://iamcredentials.googleapis.com",
     "https://us-east-1.iamcredentials.googleapis.com",
     "https://US-EAST-1.iamcredentials.googleapis.com",
@@ -143,8 +152,8 @@ VALID_SERVICE_ACCOUNT_IMPERSONATION_URLS = [
     "https://US-WEST-1-iamcredentials.googleapis.com",
     "https://us-west-1-iamcredentials.googleapis.com/path?query",
     "https://iamcredentials-us-east-1.p.googleapis.com",
-]
-INVALID_SERVICE_ACCOUNT_IMPERSONATION_URLS = [
+)
+INVALID_SERVICE_ACCOUNT_IMPERSONATION_URLS = (
     "https://sts.googleapis.com",
     "iamcredentials.googleapis.com",
     "https://",
@@ -173,7 +182,101 @@ INVALID_SERVICE_ACCOUNT_IMPERSONATION_URLS = [
     "https://iamcredentials-xyz.p1.googleapis.com",
     "https://iamcredentials-xyz.p.foo.com",
     "https://iamcredentials-xyz.p.foo.googleapis.com",
-]
+)
+
+
+SA_ACCESS_TOKEN = "SA_ACCESS_TOKEN"
+
+
+# Identity pool config using every supported option, shared by the from_info
+# and from_file tests, and the constructor call it is expected to produce.
+FULL_OPTIONS_INFO = types.MappingProxyType(
+    {
+        "audience": AUDIENCE,
+        "subject_token_type": SUBJECT_TOKEN_TYPE,
+        "token_url": TOKEN_URL,
+        "token_info_url": TOKEN_INFO_URL,
+        "service_account_impersonation_url": SERVICE_ACCOUNT_IMPERSONATION_URL,
+        "service_account_impersonation": {"token_lifetime_seconds": 2800},
+        "client_id": CLIENT_ID,
+        "client_secret": CLIENT_SECRET,
+        "quota_project_id": QUOTA_PROJECT_ID,
+        "credential_source": {"file": SUBJECT_TOKEN_TEXT_FILE},
+    }
+)
+FULL_OPTIONS_INIT_CALL = types.MappingProxyType(
+    {
+        "audience": AUDIENCE,
+        "subject_token_type": SUBJECT_TOKEN_TYPE,
+        "token_url": TOKEN_URL,
+        "token_info_url": TOKEN_INFO_URL,
+        "service_account_impersonation_url": SERVICE_ACCOUNT_IMPERSONATION_URL,
+        "service_account_impersonation_options": {"token_lifetime_seconds": 2800},
+        "client_id": CLIENT_ID,
+        "client_secret": CLIENT_SECRET,
+        "credential_source": {"file": SUBJECT_TOKEN_TEXT_FILE},
+        "subject_token_supplier": None,
+        "quota_project_id": QUOTA_PROJECT_ID,
+        "workforce_pool_user_project": None,
+        "universe_domain": DEFAULT_UNIVERSE_DOMAIN,
+        "trust_boundary": None,
+    }
+)
+
+
+@pytest.fixture(scope="module")
+def config_files(tmp_path_factory):
+    """Writes the from_file() configs once and returns their paths."""
+    config_dir = tmp_path_factory.mktemp("identity_pool_configs")
+    credential_source = {"file": SUBJECT_TOKEN_TEXT_FILE}
+    configs = {
+        "full": dict(FULL_OPTIONS_INFO),
+        "required": {
+            "audience": AUDIENCE,
+            "subject_token_type": SUBJECT_TOKEN_TYPE,
+            "token_url": TOKEN_URL,
+            "credential_source": credential_source,
+        },
+        "workforce": {
+            "audience": WORKFORCE_AUDIENCE,
+            "subject_token_type": WORKFORCE_SUBJECT_TOKEN_TYPE,
+            "token_url": TOKEN_URL,
+            "credential_source": credential_source,
+            "workforce_pool_user_project": WORKFORCE_POOL_USER_PROJECT,
+        },
+    }
+    paths = {}
+    for name, info in configs.items():
+        config_file = config_dir / "{}.json".format(name)
+        config_file.write_bytes(json.dumps(info).encode("utf-8"))
+        paths[name] = str(config_file)
+    return types.SimpleNamespace(**paths)
+
+
+@pytest.fixture(scope="session")
+def empty_subject_token_file(tmp_path_factory):
+    """Writes an empty subject token file once per session."""
+    empty_file = tmp_path_factory.mktemp("identity_pool") / "empty.txt"
+    empty_file.write_text("")
+    return str(empty_file)
+
+
+@pytest.fixture(scope="session")
+def invalid_json_subject_token_file(tmp_path_factory):
+    """Writes a subject token file holding malformed JSON once per session."""
+    invalid_json_file = tmp_path_factory.mktemp("identity_pool") / "invalid.json"
+    invalid_json_file.write_text("{")
+    return str(invalid_json_file)
+
+
+class _FakeResponse(object):
+    """Lightweight stand-in for a transport.Response."""
+
+    __slots__ = ("status", "data")
+
+    def __init__(self, status, data):
+        self.status = status
+        self.data = data
 
 
 class TestSubjectTokenSupplier(identity_pool.SubjectTokenSupplier):
@@ -192,42 +295,205 @@ class TestSubjectTokenSupplier(identity_pool.SubjectTokenSupplier):
         return self._subject_token
 
 
-class TestCredentials(object):
-    CREDENTIAL_SOURCE_TEXT = {"file": SUBJECT_TOKEN_TEXT_FILE}
-    CREDENTIAL_SOURCE_JSON = {
-        "file": SUBJECT_TOKEN_JSON_FILE,
-        "format": {"type": "json", "subject_token_field_name": "access_token"},
-    }
-    CREDENTIAL_URL = "http://fakeurl.com"
-    CREDENTIAL_SOURCE_TEXT_URL = {"url": CREDENTIAL_URL}
-    CREDENTIAL_SOURCE_JSON_URL = {
-        "url": CREDENTIAL_URL,
-        "format": {"type": "json", "subject_token_field_name": "access_token"},
-    }
-    CREDENTIAL_SOURCE_CERTIFICATE = {
-        "certificate": {"use_default_certificate_config": "true"}
-    }
-    CREDENTIAL_SOURCE_CERTIFICATE_NOT_DEFAULT = {
-        "certificate": {"certificate_config_location": "path/to/config"}
+@pytest.fixture(scope="module")
+def json_supplier():
+    """A stateless supplier returning the JSON file subject token."""
+    return TestSubjectTokenSupplier(subject_token=JSON_FILE_SUBJECT_TOKEN)
+
+
+# Constructor arguments that identity_pool.Credentials must reject, along with
+# the ValueError message they are expected to produce.
+_INVALID_CTOR_CASES = [
+    pytest.param(
+        {
+            "audience": AUDIENCE,
+            "workforce_pool_user_project": WORKFORCE_POOL_USER_PROJECT,
+        },
+        r"workforce_pool_user_project should not be set for non-workforce "
+        r"pool credentials",
+        id="nonworkforce_with_workforce_pool_user_project",
+    ),
+    pytest.param(
+        {"credential_source": {"unsupported": "value"}},
+        r"Missing credential_source",
+        id="unsupported_options",
+    ),
+    pytest.param(
+        {
+            "credential_source": {
+                "url": CREDENTIAL_URL,
+                "file": SUBJECT_TOKEN_TEXT_FILE,
+            }
+        },
+        r"Ambiguous credential_source",
+        id="url_and_file",
+    ),
+    pytest.param(
+        {
+            "credential_source": {
+                "url": CREDENTIAL_URL,
+                "certificate": {
+                    "certificate": {"use_default_certificate_config": True}
+                },
+            }
+        },
+        r"Ambiguous credential_source",
+        id="url_and_certificate",
+    ),
+    pytest.param(
+        {
+            "credential_source": {
+                "file": SUBJECT_TOKEN_TEXT_FILE,
+                "certificate": {"certificate": {"use_default_certificate": True}},
+            }
+        },
+        r"Ambiguous credential_source",
+        id="file_and_certificate",
+    ),
+    pytest.param(
+        {
+            "credential_source": {
+                "file": SUBJECT_TOKEN_TEXT_FILE,
+                "url": CREDENTIAL_URL,
+                "certificate": {"certificate": {"use_default_certificate": True}},
+            }
+        },
+        r"Ambiguous credential_source",
+        id="url_file_and_certificate",
+    ),
+    pytest.param(
+        {
+            "credential_source": {
+                "url": CREDENTIAL_URL,
+                "environment_id": "aws1",
+            }
+        },
+        r"Invalid Identity Pool credential_source field 'environment_id'",
+        id="environment_id",
+    ),
+    pytest.param(
+        {"credential_source": "non-dict"},
+        r"Invalid credential_source. The credential_source is not a dict.",
+        id="credential_source_not_a_dict",
+    ),
+    pytest.param(
+        {},
+        r"A valid credential source or a subject token supplier must be provided.",
+        id="no_credential_source_or_supplier",
+    ),
+    pytest.param(
+        {
+            "credential_source": {"file": SUBJECT_TOKEN_TEXT_FILE},
+            "subject_token_supplier": TestSubjectTokenSupplier(),
+        },
+        r"Identity pool credential cannot have both a credential source and a "
+        r"subject token supplier.",
+        id="both_credential_source_and_supplier",
+    ),
+    pytest.param(
+        {"credential_source": {"file": "test.txt", "format": {"type": "xml"}}},
+        r"Invalid credential_source format 'xml'",
+        id="credential_source_format_type",
+    ),
+    pytest.param(
+        {"credential_source": {"file": "test.txt", "format": {"type": "json"}}},
+        r"Missing subject_token_field_name for JSON credential_source format",
+        id="missing_subject_token_field_name",
+    ),
+    pytest.param(
+        {
+            "credential_source": {
+                "certificate": {
+                    "use_default_certificate_config": True,
+                    "certificate_config_location": "test",
+                }
+            }
+        },
+        r"Invalid certificate configuration",
+        id="default_and_file_location_certificate",
+    ),
+    pytest.param(
+        {
+            "credential_source": {
+                "certificate": {"use_default_certificate_config": False}
+            }
+        },
+        r"Invalid certificate configuration",
+        id="no_default_or_file_location_certificate",
+    ),
+]
+
+
+CREDENTIAL_SOURCE_TEXT = {"file": SUBJECT_TOKEN_TEXT_FILE}
+CREDENTIAL_SOURCE_JSON = {
+    "file": SUBJECT_TOKEN_JSON_FILE,
+    "format": {"type": "json", "subject_token_field_name": "access_token"},
+}
+CREDENTIAL_SOURCE_TEXT_URL = {"url": CREDENTIAL_URL}
+CREDENTIAL_SOURCE_JSON_URL = {
+    "url": CREDENTIAL_URL,
+    "format": {"type": "json", "subject_token_field_name": "access_token"},
+}
+CREDENTIAL_SOURCE_CERTIFICATE = {
+    "certificate": {"use_default_certificate_config": "true"}
+}
+CREDENTIAL_SOURCE_CERTIFICATE_NOT_DEFAULT = {
+    "certificate": {"certificate_config_location": "path/to/config"}
+}
+CREDENTIAL_SOURCE_CERTIFICATE_TRUST_CHAIN_WITH_LEAF = {
+    "certificate": {
+        "use_default_certificate_config": "true",
+        "trust_chain_path": TRUST_CHAIN_WITH_LEAF_FILE,
     }
-    CREDENTIAL_SOURCE_CERTIFICATE_TRUST_CHAIN_WITH_LEAF = {
-        "certificate": {
-            "use_default_certificate_config": "true",
-            "trust_chain_path": TRUST_CHAIN_WITH_LEAF_FILE,
-        }
+}
+CREDENTIAL_SOURCE_CERTIFICATE_TRUST_CHAIN_WITHOUT_LEAF = {
+    "certificate": {
+        "use_default_certificate_config": "true",
+        "trust_chain_path": TRUST_CHAIN_WITHOUT_LEAF_FILE,
     }
-    CREDENTIAL_SOURCE_CERTIFICATE_TRUST_CHAIN_WITHOUT_LEAF = {
-        "certificate": {
-            "use_default_certificate_config": "true",
-            "trust_chain_path": TRUST_CHAIN_WITHOUT_LEAF_FILE,
-        }
+}
+CREDENTIAL_SOURCE_CERTIFICATE_TRUST_CHAIN_WRONG_ORDER = {
+    "certificate": {
+        "use_default_certificate_config": "true",
+        "trust_chain_path": TRUST_CHAIN_WRONG_ORDER_FILE,
     }
-    CREDENTIAL_SOURCE_CERTIFICATE_TRUST_CHAIN_WRONG_ORDER = {
-        "certificate": {
-            "use_default_certificate_config": "true",
-            "trust_chain_path": TRUST_CHAIN_WRONG_ORDER_FILE,
-        }
+}
+
+
+# Error messages raised for the file and URL sourced credentials above.
+URL_SUBJECT_TOKEN_NOT_FOUND_ERROR = (
+    f"Unable to parse subject_token from JSON file '{CREDENTIAL_URL}' "
+    "using key 'not_found'"
+)
+URL_SUBJECT_TOKEN_INVALID_JSON_ERROR = (
+    f"Unable to parse subject_token from JSON file '{CREDENTIAL_URL}' "
+    "using key 'access_token'"
+)
+JSON_FILE_SUBJECT_TOKEN_NOT_FOUND_ERROR = (
+    f"Unable to parse subject_token from JSON file '{SUBJECT_TOKEN_JSON_FILE}' "
+    "using key 'not_found'"
+)
+MTLS_NOT_CONFIGURED_ERROR = (
+    "The credential is not configured to use mtls requests. The credential "
+    'should include a "certificate" section in the credential source.'
+)
+
+
+def _expected_info(**overrides):
+    """Returns the Credentials.info expected from make_credentials()."""
+    info = {
+        "type": "external_account",
+        "audience": AUDIENCE,
+        "subject_token_type": SUBJECT_TOKEN_TYPE,
+        "token_url": TOKEN_URL,
+        "token_info_url": TOKEN_INFO_URL,
+        "universe_domain": DEFAULT_UNIVERSE_DOMAIN,
     }
+    info.update(overrides)
+    return info
+
+
+class TestCredentials(object):
     SUCCESS_RESPONSE = {
         "access_token": "ACCESS_TOKEN",
         "issued_token_type": "urn:ietf:params:oauth:token-type:access_token",
@@ -235,32 +501,24 @@ class TestCredentials(object):
         "expires_in": 3600,
         "scope": " ".join(SCOPES),
     }
+    SUCCESS_RESPONSE_BYTES = json.dumps(SUCCESS_RESPONSE).encode("utf-8")
 
     @classmethod
     def make_mock_response(cls, status, data):
-        response = mock.create_autospec(transport.Response, instance=True)
-        response.status = status
-        if isinstance(data, dict):
-            response.data = json.dumps(data).encode("utf-8")
-        else:
-            response.data = data
-        return response
+        # Bodies are used as given; JSON payloads are encoded once at module
+        # scope rather than on every request.
+        return _FakeResponse(status, data)
 
     @classmethod
     def make_mock_request(
         cls, token_status=http_client.OK, token_data=None, *extra_requests
     ):
-        responses = []
-        responses.append(cls.make_mock_response(token_status, token_data))
-
-        while len(extra_requests) > 0:
-            # If service account impersonation is requested, mock the expected response.
-            status, data, extra_requests = (
-                extra_requests[0],
-                extra_requests[1],
-                extra_requests[2:],
-            )
-            responses.append(cls.make_mock_response(status, data))
+        responses = [cls.make_mock_response(token_status, token_data)]
+        # Any extra (status, data) pairs, e.g. the service account
+        # impersonation response, follow the first response in order.
+        responses.extend(
+            cls.make_mock_response(status, data) for status, data in extra_requests
+        )
 
         request = mock.create_autospec(transport.Request)
         request.side_effect = responses
@@ -284,10 +542,12 @@ class TestCredentials(object):
         assert request_kwargs["method"] == "POST"
         assert request_kwargs["headers"] == headers
         assert request_kwargs["body"] is not None
-        body_tuples = urllib.parse.parse_qsl(request_kwargs["body"])
-        assert len(body_tuples) == len(request_data.keys())
-        for k, v in body_tuples:
-            assert v.decode("utf-8") == request_data[k.decode("utf-8")]
+        # Keep every pair so that a repeated field fails the length check.
+        pairs = [p.split(b"=", 1) for p in request_kwargs["body"].split(b"&")]
+        assert len(pairs) == len(request_data)
+        for k, v in pairs:
+            v = urllib.parse.unquote_plus(v.decode("utf-8"))
+            assert v == request_data[k.decode("utf-8")]
 
     @classmethod
     def assert_impersonation_request_kwargs(
@@ -327,7 +587,7 @@ class TestCredentials(object):
         expected parameters.
         """
         # STS token exchange request/response.
-        token_response = cls.SUCCESS_RESPONSE.copy()
+        token_response = cls.SUCCESS_RESPONSE
         token_headers = {"Content-Type": "application/x-www-form-urlencoded"}
         if basic_auth_encoding:
             token_headers["Authorization"] = "Basic " + basic_auth_encoding
@@ -377,10 +637,9 @@ class TestCredentials(object):
                 _helpers.utcnow().replace(microsecond=0)
                 + datetime.timedelta(seconds=3600)
             ).isoformat("T") + "Z"
-            impersonation_response = {
-                "accessToken": "SA_ACCESS_TOKEN",
-                "expireTime": expire_time,
-            }
+            impersonation_response = json.dumps(
+                {"accessToken": SA_ACCESS_TOKEN, "expireTime": expire_time}
+            ).encode("utf-8")
             impersonation_headers = {
                 "Content-Type": "application/json",
                 "authorization": "Bearer {}".format(token_response["access_token"]),
@@ -402,13 +661,14 @@ class TestCredentials(object):
             requests.append((http_client.OK, credential_data))
 
         token_request_index = len(requests)
-        requests.append((http_client.OK, token_response))
+        requests.append((http_client.OK, cls.SUCCESS_RESPONSE_BYTES))
 
         if service_account_impersonation_url:
             impersonation_request_index = len(requests)
             requests.append((http_client.OK, impersonation_response))
 
-        request = cls.make_mock_request(*[el for req in requests for el in req])
+        first_status, first_data = requests[0]
+        request = cls.make_mock_request(first_status, first_data, *requests[1:])
 
         with mock.patch(
             "google.auth.metrics.token_request_access_token_impersonate",
@@ -435,7 +695,7 @@ class TestCredentials(object):
                 impersonation_request_data,
                 service_account_impersonation_url,
             )
-            assert credentials.token == impersonation_response["accessToken"]
+            assert credentials.token == SA_ACCESS_TOKEN
         else:
             assert credentials.token == token_response["access_token"]
         assert credentials.quota_project_id == quota_project_id
@@ -475,50 +735,27 @@ class TestCredentials(object):
             workforce_pool_user_project=workforce_pool_user_project,
         )
 
-    @mock.patch.object(identity_pool.Credentials, "__init__", return_value=None)
+    @pytest.fixture
+    def mock_init(self):
+        with mock.patch.object(
+            identity_pool.Credentials, "__init__", return_value=None
+        ) as mock_init:
+            yield mock_init
+
     def test_from_info_full_options(self, mock_init):
-        credentials = identity_pool.Credentials.from_info(
-            {
-                "audience": AUDIENCE,
-                "subject_token_type": SUBJECT_TOKEN_TYPE,
-                "token_url": TOKEN_URL,
-                "token_info_url": TOKEN_INFO_URL,
-                "service_account_impersonation_url": SERVICE_ACCOUNT_IMPERSONATION_URL,
-                "service_account_impersonation": {"token_lifetime_seconds": 2800},
-                "client_id": CLIENT_ID,
-                "client_secret": CLIENT_SECRET,
-                "quota_project_id": QUOTA_PROJECT_ID,
-                "credential_source": self.CREDENTIAL_SOURCE_TEXT,
-            }
-        )
+        credentials = identity_pool.Credentials.from_info(FULL_OPTIONS_INFO)
 
         # Confirm identity_pool.Credentials instantiated with expected attributes.
         assert isinstance(credentials, identity_pool.Credentials)
-        mock_init.assert_called_once_with(
-            audience=AUDIENCE,
-            subject_token_type=SUBJECT_TOKEN_TYPE,
-            token_url=TOKEN_URL,
-            token_info_url=TOKEN_INFO_URL,
-            service_account_impersonation_url=SERVICE_ACCOUNT_IMPERSONATION_URL,
-            service_account_impersonation_options={"token_lifetime_seconds": 2800},
-            client_id=CLIENT_ID,
-            client_secret=CLIENT_SECRET,
-            credential_source=self.CREDENTIAL_SOURCE_TEXT,
-            subject_token_supplier=None,
-            quota_project_id=QUOTA_PROJECT_ID,
-            workforce_pool_user_project=None,
-            universe_domain=DEFAULT_UNIVERSE_DOMAIN,
-            trust_boundary=None,
-        )
+        mock_init.assert_called_once_with(**FULL_OPTIONS_INIT_CALL)
 
-    @mock.patch.object(identity_pool.Credentials, "__init__", return_value=None)
     def test_from_info_required_options_only(self, mock_init):
         credentials = identity_pool.Credentials.from_info(
             {
                 "audience": AUDIENCE,
                 "subject_token_type": SUBJECT_TOKEN_TYPE,
                 "token_url": TOKEN_URL,
-                "credential_source": self.CREDENTIAL_SOURCE_TEXT,
+                "credential_source": CREDENTIAL_SOURCE_TEXT,
             }
         )
 
@@ -533,7 +770,7 @@ class TestCredentials(object):
             service_account_impersonation_options={},
             client_id=None,
             client_secret=None,
-            credential_source=self.CREDENTIAL_SOURCE_TEXT,
+            credential_source=CREDENTIAL_SOURCE_TEXT,
             subject_token_supplier=None,
             quota_project_id=None,
             workforce_pool_user_project=None,
@@ -541,7 +778,6 @@ class TestCredentials(object):
             trust_boundary=None,
         )
 
-    @mock.patch.object(identity_pool.Credentials, "__init__", return_value=None)
     def test_from_info_supplier(self, mock_init):
         supplier = TestSubjectTokenSupplier()
 
@@ -573,14 +809,13 @@ class TestCredentials(object):
             trust_boundary=None,
         )
 
-    @mock.patch.object(identity_pool.Credentials, "__init__", return_value=None)
     def test_from_info_workforce_pool(self, mock_init):
         credentials = identity_pool.Credentials.from_info(
             {
                 "audience": WORKFORCE_AUDIENCE,
                 "subject_token_type": WORKFORCE_SUBJECT_TOKEN_TYPE,
                 "token_url": TOKEN_URL,
-                "credential_source": self.CREDENTIAL_SOURCE_TEXT,
+                "credential_source": CREDENTIAL_SOURCE_TEXT,
                 "workforce_pool_user_project": WORKFORCE_POOL_USER_PROJECT,
             }
         )
@@ -596,7 +831,7 @@ class TestCredentials(object):
             service_account_impersonation_options={},
             client_id=None,
             client_secret=None,
-            credential_source=self.CREDENTIAL_SOURCE_TEXT,
+            credential_source=CREDENTIAL_SOURCE_TEXT,
             subject_token_supplier=None,
             quota_project_id=None,
             workforce_pool_user_project=WORKFORCE_POOL_USER_PROJECT,
@@ -604,54 +839,15 @@ class TestCredentials(object):
             trust_boundary=None,
         )
 
-    @mock.patch.object(identity_pool.Credentials, "__init__", return_value=None)
-    def test_from_file_full_options(self, mock_init, tmpdir):
-        info = {
-            "audience": AUDIENCE,
-            "subject_token_type": SUBJECT_TOKEN_TYPE,
-            "token_url": TOKEN_URL,
-            "token_info_url": TOKEN_INFO_URL,
-            "service_account_impersonation_url": SERVICE_ACCOUNT_IMPERSONATION_URL,
-            "service_account_impersonation": {"token_lifetime_seconds": 2800},
-            "client_id": CLIENT_ID,
-            "client_secret": CLIENT_SECRET,
-            "quota_project_id": QUOTA_PROJECT_ID,
-            "credential_source": self.CREDENTIAL_SOURCE_TEXT,
-        }
-        config_file = tmpdir.join("config.json")
-        config_file.write(json.dumps(info))
-        credentials = identity_pool.Credentials.from_file(str(config_file))
+    def test_from_file_full_options(self, mock_init, config_files):
+        credentials = identity_pool.Credentials.from_file(config_files.full)
 
         # Confirm identity_pool.Credentials instantiated with expected attributes.
         assert isinstance(credentials, identity_pool.Credentials)
-        mock_init.assert_called_once_with(
-            audience=AUDIENCE,
-            subject_token_type=SUBJECT_TOKEN_TYPE,
-            token_url=TOKEN_URL,
-            token_info_url=TOKEN_INFO_URL,
-            service_account_impersonation_url=SERVICE_ACCOUNT_IMPERSONATION_URL,
-            service_account_impersonation_options={"token_lifetime_seconds": 2800},
-            client_id=CLIENT_ID,
-            client_secret=CLIENT_SECRET,
-            credential_source=self.CREDENTIAL_SOURCE_TEXT,
-            subject_token_supplier=None,
-            quota_project_id=QUOTA_PROJECT_ID,
-            workforce_pool_user_project=None,
-            universe_domain=DEFAULT_UNIVERSE_DOMAIN,
-            trust_boundary=None,
-        )
+        mock_init.assert_called_once_with(**FULL_OPTIONS_INIT_CALL)
 
-    @mock.patch.object(identity_pool.Credentials, "__init__", return_value=None)
-    def test_from_file_required_options_only(self, mock_init, tmpdir):
-        info = {
-            "audience": AUDIENCE,
-            "subject_token_type": SUBJECT_TOKEN_TYPE,
-            "token_url": TOKEN_URL,
-            "credential_source": self.CREDENTIAL_SOURCE_TEXT,
-        }
-        config_file = tmpdir.join("config.json")
-        config_file.write(json.dumps(info))
-        credentials = identity_pool.Credentials.from_file(str(config_file))
+    def test_from_file_required_options_only(self, mock_init, config_files):
+        credentials = identity_pool.Credentials.from_file(config_files.required)
 
         # Confirm identity_pool.Credentials instantiated with expected attributes.
         assert isinstance(credentials, identity_pool.Credentials)
@@ -664,7 +860,7 @@ class TestCredentials(object):
             service_account_impersonation_options={},
             client_id=None,
             client_secret=None,
-            credential_source=self.CREDENTIAL_SOURCE_TEXT,
+            credential_source=CREDENTIAL_SOURCE_TEXT,
             subject_token_supplier=None,
             quota_project_id=None,
             workforce_pool_user_project=None,
@@ -672,18 +868,8 @@ class TestCredentials(object):
             trust_boundary=None,
         )
 
-    @mock.patch.object(identity_pool.Credentials, "__init__", return_value=None)
-    def test_from_file_workforce_pool(self, mock_init, tmpdir):
-        info = {
-            "audience": WORKFORCE_AUDIENCE,
-            "subject_token_type": WORKFORCE_SUBJECT_TOKEN_TYPE,
-            "token_url": TOKEN_URL,
-            "credential_source": self.CREDENTIAL_SOURCE_TEXT,
-            "workforce_pool_user_project": WORKFORCE_POOL_USER_PROJECT,
-        }
-        config_file = tmpdir.join("config.json")
-        config_file.write(json.dumps(info))
-        credentials = identity_pool.Credentials.from_file(str(config_file))
+    def test_from_file_workforce_pool(self, mock_init, config_files):
+        credentials = identity_pool.Credentials.from_file(config_files.workforce)
 
         # Confirm identity_pool.Credentials instantiated with expected attributes.
         assert isinstance(credentials, identity_pool.Credentials)
@@ -696,7 +882,7 @@ class TestCredentials(object):
             service_account_impersonation_options={},
             client_id=None,
             client_secret=None,
-            credential_source=self.CREDENTIAL_SOURCE_TEXT,
+            credential_source=CREDENTIAL_SOURCE_TEXT,
             subject_token_supplier=None,
             quota_project_id=None,
             workforce_pool_user_project=WORKFORCE_POOL_USER_PROJECT,
@@ -704,232 +890,64 @@ class TestCredentials(object):
             trust_boundary=None,
         )
 
-    def test_constructor_nonworkforce_with_workforce_pool_user_project(self):
-        with pytest.raises(ValueError) as excinfo:
-            self.make_credentials(
-                audience=AUDIENCE,
-                workforce_pool_user_project=WORKFORCE_POOL_USER_PROJECT,
-            )
-
-        assert excinfo.match(
-            "workforce_pool_user_project should not be set for non-workforce "
-            "pool credentials"
-        )
-
-    def test_constructor_invalid_options(self):
-        credential_source = {"unsupported": "value"}
-
-        with pytest.raises(ValueError) as excinfo:
-            self.make_credentials(credential_source=credential_source)
-
-        assert excinfo.match(r"Missing credential_source")
-
-    def test_constructor_invalid_options_url_and_file(self):
-        credential_source = {
-            "url": self.CREDENTIAL_URL,
-            "file": SUBJECT_TOKEN_TEXT_FILE,
-        }
-
-        with pytest.raises(ValueError) as excinfo:
-            self.make_credentials(credential_source=credential_source)
-
-        assert excinfo.match(r"Ambiguous credential_source")
-
-    def test_constructor_invalid_options_url_and_certificate(self):
-        credential_source = {
-            "url": self.CREDENTIAL_URL,
-            "certificate": {"certificate": {"use_default_certificate_config": True}},
-        }
-
-        with pytest.raises(ValueError) as excinfo:
-            self.make_credentials(credential_source=credential_source)
-
-        assert excinfo.match(r"Ambiguous credential_source")
-
-    def test_constructor_invalid_options_file_and_certificate(self):
-        credential_source = {
-            "file": SUBJECT_TOKEN_TEXT_FILE,
-            "certificate": {"certificate": {"use_default_certificate": True}},
-        }
-
-        with pytest.raises(ValueError) as excinfo:
-            self.make_credentials(credential_source=credential_source)
-
-        assert excinfo.match(r"Ambiguous credential_source")
-
-    def test_constructor_invalid_options_url_file_and_certificate(self):
-        credential_source = {
-            "file": SUBJECT_TOKEN_TEXT_FILE,
-            "url": self.CREDENTIAL_URL,
-            "certificate": {"certificate": {"use_default_certificate": True}},
-        }
-
-        with pytest.raises(ValueError) as excinfo:
-            self.make_credentials(credential_source=credential_source)
-
-        assert excinfo.match(r"Ambiguous credential_source")
-
-    def test_constructor_invalid_options_environment_id(self):
-        credential_source = {"url": self.CREDENTIAL_URL, "environment_id": "aws1"}
-
-        with pytest.raises(ValueError) as excinfo:
-            self.make_credentials(credential_source=credential_source)
-
-        assert excinfo.match(
-            r"Invalid Identity Pool credential_source field 'environment_id'"
-        )
-
-    def test_constructor_invalid_credential_source(self):
-        with pytest.raises(ValueError) as excinfo:
-            self.make_credentials(credential_source="non-dict")
-
-        assert excinfo.match(
-            r"Invalid credential_source. The credential_source is not a dict."
-        )
-
-    def test_constructor_invalid_no_credential_source_or_supplier(self):
-        with pytest.raises(ValueError) as excinfo:
-            self.make_credentials()
-
-        assert excinfo.match(
-            r"A valid credential source or a subject token supplier must be provided."
-        )
-
-    def test_constructor_invalid_both_credential_source_and_supplier(self):
-        supplier = TestSubjectTokenSupplier()
-        with pytest.raises(ValueError) as excinfo:
-            self.make_credentials(
-                credential_source=self.CREDENTIAL_SOURCE_TEXT,
-                subject_token_supplier=supplier,
-            )
-
-        assert excinfo.match(
-            r"Identity pool credential cannot have both a credential source and a subject token supplier."
-        )
-
-    def test_constructor_invalid_credential_source_format_type(self):
-        credential_source = {"file": "test.txt", "format": {"type": "xml"}}
-
-        with pytest.raises(ValueError) as excinfo:
-            self.make_credentials(credential_source=credential_source)
-
-        assert excinfo.match(r"Invalid credential_source format 'xml'")
-
-    def test_constructor_missing_subject_token_field_name(self):
-        credential_source = {"file": "test.txt", "format": {"type": "json"}}
-
-        with pytest.raises(ValueError) as excinfo:
-            self.make_credentials(credential_source=credential_source)
-
-        assert excinfo.match(
-            r"Missing subject_token_field_name for JSON credential_source format"
-        )
-
-    def test_constructor_default_and_file_location_certificate(self):
-        credential_source = {
-            "certificate": {
-                "use_default_certificate_config": True,
-                "certificate_config_location": "test",
-            }
-        }
-
-        with pytest.raises(ValueError) as excinfo:
-            self.make_credentials(credential_source=credential_source)
-
-        assert excinfo.match(r"Invalid certificate configuration")
-
-    def test_constructor_no_default_or_file_location_certificate(self):
-        credential_source = {"certificate": {"use_default_certificate_config": False}}
-
-        with pytest.raises(ValueError) as excinfo:
-            self.make_credentials(credential_source=credential_source)
-
-        assert excinfo.match(r"Invalid certificate configuration")
-
-    def test_info_with_workforce_pool_user_project(self):
-        credentials = self.make_credentials(
-            audience=WORKFORCE_AUDIENCE,
-            subject_token_type=WORKFORCE_SUBJECT_TOKEN_TYPE,
-            credential_source=self.CREDENTIAL_SOURCE_TEXT_URL.copy(),
-            workforce_pool_user_project=WORKFORCE_POOL_USER_PROJECT,
-        )
-
-        assert credentials.info == {
-            "type": "external_account",
-            "audience": WORKFORCE_AUDIENCE,
-            "subject_token_type": WORKFORCE_SUBJECT_TOKEN_TYPE,
-            "token_url": TOKEN_URL,
-            "token_info_url": TOKEN_INFO_URL,
-            "credential_source": self.CREDENTIAL_SOURCE_TEXT_URL,
-            "workforce_pool_user_project": WORKFORCE_POOL_USER_PROJECT,
-            "universe_domain": DEFAULT_UNIVERSE_DOMAIN,
-        }
-
-    def test_info_with_file_credential_source(self):
-        credentials = self.make_credentials(
-            credential_source=self.CREDENTIAL_SOURCE_TEXT_URL.copy()
-        )
-
-        assert credentials.info == {
-            "type": "external_account",
-            "audience": AUDIENCE,
-            "subject_token_type": SUBJECT_TOKEN_TYPE,
-            "token_url": TOKEN_URL,
-            "token_info_url": TOKEN_INFO_URL,
-            "credential_source": self.CREDENTIAL_SOURCE_TEXT_URL,
-            "universe_domain": DEFAULT_UNIVERSE_DOMAIN,
-        }
-
-    def test_info_with_url_credential_source(self):
-        credentials = self.make_credentials(
-            credential_source=self.CREDENTIAL_SOURCE_JSON_URL.copy()
-        )
-
-        assert credentials.info == {
-            "type": "external_account",
-            "audience": AUDIENCE,
-            "subject_token_type": SUBJECT_TOKEN_TYPE,
-            "token_url": TOKEN_URL,
-            "token_info_url": TOKEN_INFO_URL,
-            "credential_source": self.CREDENTIAL_SOURCE_JSON_URL,
-            "universe_domain": DEFAULT_UNIVERSE_DOMAIN,
-        }
-
-    def test_info_with_certificate_credential_source(self):
-        credentials = self.make_credentials(
-            credential_source=self.CREDENTIAL_SOURCE_CERTIFICATE.copy()
-        )
-
-        assert credentials.info == {
-            "type": "external_account",
-            "audience": AUDIENCE,
-            "subject_token_type": SUBJECT_TOKEN_TYPE,
-            "token_url": TOKEN_URL,
-            "token_info_url": TOKEN_INFO_URL,
-            "credential_source": self.CREDENTIAL_SOURCE_CERTIFICATE,
-            "universe_domain": DEFAULT_UNIVERSE_DOMAIN,
-        }
+    @pytest.mark.parametrize("kwargs, pattern", _INVALID_CTOR_CASES)
+    def test_constructor_invalid(self, kwargs, pattern):
+        with pytest.raises(ValueError, match=pattern):
+            self.make_credentials(**kwargs)
+
+    @pytest.mark.parametrize(
+        "ctor_kwargs, expected_overrides",
+        [
+            pytest.param(
+                {
+                    "audience": WORKFORCE_AUDIENCE,
+                    "subject_token_type": WORKFORCE_SUBJECT_TOKEN_TYPE,
+                    "credential_source": CREDENTIAL_SOURCE_TEXT_URL,
+                    "workforce_pool_user_project": WORKFORCE_POOL_USER_PROJECT,
+                },
+                {
+                    "audience": WORKFORCE_AUDIENCE,
+                    "subject_token_type": WORKFORCE_SUBJECT_TOKEN_TYPE,
+                    "workforce_pool_user_project": WORKFORCE_POOL_USER_PROJECT,
+                },
+                id="workforce_pool_user_project",
+            ),
+            pytest.param(
+                {"credential_source": CREDENTIAL_SOURCE_TEXT_URL},
+                {},
+                id="text_url_credential_source",
+            ),
+            pytest.param(
+                {"credential_source": CREDENTIAL_SOURCE_JSON_URL},
+                {},
+                id="json_url_credential_source",
+            ),
+            pytest.param(
+                {"credential_source": CREDENTIAL_SOURCE_CERTIFICATE},
+                {},
+                id="certificate_credential_source",
+            ),
+            pytest.param(
+                {"credential_source": CREDENTIAL_SOURCE_CERTIFICATE_NOT_DEFAULT},
+                {},
+                id="non_default_certificate_credential_source",
+            ),
+        ],
+    )
+    def test_info(self, ctor_kwargs, expected_overrides):
+        # Credentials.info deep copies the credential source, so the shared
+        # module level dicts can be passed in without copying them first.
+        credentials = self.make_credentials(**ctor_kwargs)
 
-    def test_info_with_non_default_certificate_credential_source(self):
-        credentials = self.make_credentials(
-            credential_source=self.CREDENTIAL_SOURCE_CERTIFICATE_NOT_DEFAULT.copy()
+        assert credentials.info == _expected_info(
+            credential_source=ctor_kwargs["credential_source"], **expected_overrides
         )
 
-        assert credentials.info == {
-            "type": "external_account",
-            "audience": AUDIENCE,
-            "subject_token_type": SUBJECT_TOKEN_TYPE,
-            "token_url": TOKEN_URL,
-            "token_info_url": TOKEN_INFO_URL,
-            "credential_source": self.CREDENTIAL_SOURCE_CERTIFICATE_NOT_DEFAULT,
-            "universe_domain": DEFAULT_UNIVERSE_DOMAIN,
-        }
-
     def test_info_with_default_token_url(self):
         credentials = identity_pool.Credentials(
             audience=AUDIENCE,
             subject_token_type=SUBJECT_TOKEN_TYPE,
-            credential_source=self.CREDENTIAL_SOURCE_TEXT_URL.copy(),
+            credential_source=CREDENTIAL_SOURCE_TEXT_URL,
         )
 
         assert credentials.info == {
@@ -937,7 +955,7 @@ class TestCredentials(object):
             "audience": AUDIENCE,
             "subject_token_type": SUBJECT_TOKEN_TYPE,
             "token_url": TOKEN_URL,
-            "credential_source": self.CREDENTIAL_SOURCE_TEXT_URL,
+            "credential_source": CREDENTIAL_SOURCE_TEXT_URL,
             "universe_domain": DEFAULT_UNIVERSE_DOMAIN,
         }
 
@@ -945,7 +963,7 @@ class TestCredentials(object):
         credentials = identity_pool.Credentials(
             audience=AUDIENCE,
             subject_token_type=SUBJECT_TOKEN_TYPE,
-            credential_source=self.CREDENTIAL_SOURCE_TEXT_URL.copy(),
+            credential_source=CREDENTIAL_SOURCE_TEXT_URL,
             universe_domain="testdomain.org",
         )
 
@@ -954,122 +972,92 @@ class TestCredentials(object):
             "audience": AUDIENCE,
             "subject_token_type": SUBJECT_TOKEN_TYPE,
             "token_url": "https://sts.testdomain.org/v1/token",
-            "credential_source": self.CREDENTIAL_SOURCE_TEXT_URL,
+            "credential_source": CREDENTIAL_SOURCE_TEXT_URL,
             "universe_domain": "testdomain.org",
         }
 
-    def test_retrieve_subject_token_missing_subject_token(self, tmpdir):
+    def test_retrieve_subject_token_missing_subject_token(
+        self, empty_subject_token_file
+    ):
         # Provide empty text file.
-        empty_file = tmpdir.join("empty.txt")
-        empty_file.write("")
-        credential_source = {"file": str(empty_file)}
+        credential_source = {"file": empty_subject_token_file}
         credentials = self.make_credentials(credential_source=credential_source)
 
-        with pytest.raises(exceptions.RefreshError) as excinfo:
+        with pytest.raises(
+            exceptions.RefreshError,
+            match=r"Missing subject_token in the credential_source file",
+        ):
             credentials.retrieve_subject_token(None)
 
-        assert excinfo.match(r"Missing subject_token in the credential_source file")
-
     def test_retrieve_subject_token_text_file(self):
-        credentials = self.make_credentials(
-            credential_source=self.CREDENTIAL_SOURCE_TEXT
-        )
+        credentials = self.make_credentials(credential_source=CREDENTIAL_SOURCE_TEXT)
 
         subject_token = credentials.retrieve_subject_token(None)
 
         assert subject_token == TEXT_FILE_SUBJECT_TOKEN
 
     def test_retrieve_subject_token_json_file(self):
-        credentials = self.make_credentials(
-            credential_source=self.CREDENTIAL_SOURCE_JSON
-        )
+        credentials = self.make_credentials(credential_source=CREDENTIAL_SOURCE_JSON)
 
         subject_token = credentials.retrieve_subject_token(None)
 
         assert subject_token == JSON_FILE_SUBJECT_TOKEN
 
-    @mock.patch(
-        "google.auth.transport._mtls_helper._get_workload_cert_and_key_paths",
-        return_value=(CERT_FILE, KEY_FILE),
-    )
-    def test_retrieve_subject_token_certificate_default(
-        self, mock_get_workload_cert_and_key_paths
-    ):
-        credentials = self.make_credentials(
-            credential_source=self.CREDENTIAL_SOURCE_CERTIFICATE
-        )
-
-        subject_token = credentials.retrieve_subject_token(None)
-
-        assert subject_token == json.dumps([CERT_FILE_CONTENT])
-
-    @mock.patch(
-        "google.auth.transport._mtls_helper._get_workload_cert_and_key_paths",
-        return_value=(CERT_FILE, KEY_FILE),
-    )
-    def test_retrieve_subject_token_certificate_non_default_path(
-        self, mock_get_workload_cert_and_key_paths
-    ):
-        credentials = self.make_credentials(
-            credential_source=self.CREDENTIAL_SOURCE_CERTIFICATE_NOT_DEFAULT
-        )
-
-        subject_token = credentials.retrieve_subject_token(None)
-
-        assert subject_token == json.dumps([CERT_FILE_CONTENT])
-
-    @mock.patch(
-        "google.auth.transport._mtls_helper._get_workload_cert_and_key_paths",
-        return_value=(CERT_FILE, KEY_FILE),
+    @pytest.fixture
+    def mock_cert_paths(self):
+        with mock.patch(
+            "google.auth.transport._mtls_helper._get_workload_cert_and_key_paths",
+            return_value=(CERT_FILE, KEY_FILE),
+        ) as mock_get_workload_cert_and_key_paths:
+            yield mock_get_workload_cert_and_key_paths
+
+    @pytest.mark.parametrize(
+        "credential_source,expected",
+        [
+            pytest.param(
+                CREDENTIAL_SOURCE_CERTIFICATE, _EXPECTED_CERT_JSON, id="default"
+            ),
+            pytest.param(
+                CREDENTIAL_SOURCE_CERTIFICATE_NOT_DEFAULT,
+                _EXPECTED_CERT_JSON,
+                id="non_default_path",
+            ),
+            pytest.param(
+                CREDENTIAL_SOURCE_CERTIFICATE_TRUST_CHAIN_WITH_LEAF,
+                _EXPECTED_CHAIN_JSON,
+                id="trust_chain_with_leaf",
+            ),
+            pytest.param(
+                CREDENTIAL_SOURCE_CERTIFICATE_TRUST_CHAIN_WITHOUT_LEAF,
+                _EXPECTED_CHAIN_JSON,
+                id="trust_chain_without_leaf",
+            ),
+        ],
     )
-    def test_retrieve_subject_token_certificate_trust_chain_with_leaf(
-        self, mock_get_workload_cert_and_key_paths
+    def test_retrieve_subject_token_certificate(
+        self, mock_cert_paths, credential_source, expected
     ):
-        credentials = self.make_credentials(
-            credential_source=self.CREDENTIAL_SOURCE_CERTIFICATE_TRUST_CHAIN_WITH_LEAF
-        )
+        credentials = self.make_credentials(credential_source=credential_source)
 
         subject_token = credentials.retrieve_subject_token(None)
-        assert subject_token == json.dumps([CERT_FILE_CONTENT, OTHER_CERT_FILE_CONTENT])
-
-    @mock.patch(
-        "google.auth.transport._mtls_helper._get_workload_cert_and_key_paths",
-        return_value=(CERT_FILE, KEY_FILE),
-    )
-    def test_retrieve_subject_token_certificate_trust_chain_without_leaf(
-        self, mock_get_workload_cert_and_key_paths
-    ):
-        credentials = self.make_credentials(
-            credential_source=self.CREDENTIAL_SOURCE_CERTIFICATE_TRUST_CHAIN_WITHOUT_LEAF
-        )
 
-        subject_token = credentials.retrieve_subject_token(None)
-        assert subject_token == json.dumps([CERT_FILE_CONTENT, OTHER_CERT_FILE_CONTENT])
+        assert subject_token == expected
 
-    @mock.patch(
-        "google.auth.transport._mtls_helper._get_workload_cert_and_key_paths",
-        return_value=(CERT_FILE, KEY_FILE),
-    )
     def test_retrieve_subject_token_certificate_trust_chain_invalid_order(
-        self, mock_get_workload_cert_and_key_paths
+        self, mock_cert_paths
     ):
         credentials = self.make_credentials(
-            credential_source=self.CREDENTIAL_SOURCE_CERTIFICATE_TRUST_CHAIN_WRONG_ORDER
+            credential_source=CREDENTIAL_SOURCE_CERTIFICATE_TRUST_CHAIN_WRONG_ORDER
         )
 
-        with pytest.raises(exceptions.RefreshError) as excinfo:
+        with pytest.raises(
+            exceptions.RefreshError,
+            match="The leaf certificate must be at the top of the trust chain file",
+        ):
             credentials.retrieve_subject_token(None)
 
-        assert excinfo.match(
-            "The leaf certificate must be at the top of the trust chain file"
-        )
-
-    @mock.patch(
-        "google.auth.transport._mtls_helper._get_workload_cert_and_key_paths",
-        return_value=(CERT_FILE, KEY_FILE),
-    )
     def test_retrieve_subject_token_certificate_trust_chain_file_does_not_exist(
-        self, mock_get_workload_cert_and_key_paths
+        self, mock_cert_paths
     ):
         credentials = self.make_credentials(
             credential_source={
@@ -1080,17 +1068,13 @@ class TestCredentials(object):
             }
         )
 
-        with pytest.raises(exceptions.RefreshError) as excinfo:
+        with pytest.raises(
+            exceptions.RefreshError, match="Trust chain file 'fake.pem' was not found."
+        ):
             credentials.retrieve_subject_token(None)
 
-        assert excinfo.match("Trust chain file 'fake.pem' was not found.")
-
-    @mock.patch(
-        "google.auth.transport._mtls_helper._get_workload_cert_and_key_paths",
-        return_value=(CERT_FILE, KEY_FILE),
-    )
     def test_retrieve_subject_token_certificate_invalid_trust_chain_file(
-        self, mock_get_workload_cert_and_key_paths
+        self, mock_cert_paths
     ):
         credentials = self.make_credentials(
             credential_source={
@@ -1101,11 +1085,12 @@ class TestCredentials(object):
             }
         )
 
-        with pytest.raises(exceptions.RefreshError) as excinfo:
+        with pytest.raises(
+            exceptions.RefreshError,
+            match="Error loading PEM certificates from the trust chain file",
+        ):
             credentials.retrieve_subject_token(None)
 
-        assert excinfo.match("Error loading PEM certificates from the trust chain file")
-
     def test_retrieve_subject_token_json_file_invalid_field_name(self):
         credential_source = {
             "file": SUBJECT_TOKEN_JSON_FILE,
@@ -1116,18 +1101,12 @@ class TestCredentials(object):
         with pytest.raises(exceptions.RefreshError) as excinfo:
             credentials.retrieve_subject_token(None)
 
-        assert excinfo.match(
-            "Unable to parse subject_token from JSON file '{}' using key '{}'".format(
-                SUBJECT_TOKEN_JSON_FILE, "not_found"
-            )
-        )
+        assert JSON_FILE_SUBJECT_TOKEN_NOT_FOUND_ERROR in str(excinfo.value)
 
-    def test_retrieve_subject_token_invalid_json(self, tmpdir):
+    def test_retrieve_subject_token_invalid_json(self, invalid_json_subject_token_file):
         # Provide JSON file. This should result in JSON parsing error.
-        invalid_json_file = tmpdir.join("invalid.json")
-        invalid_json_file.write("{")
         credential_source = {
-            "file": str(invalid_json_file),
+            "file": invalid_json_subject_token_file,
             "format": {"type": "json", "subject_token_field_name": "access_token"},
         }
         credentials = self.make_credentials(credential_source=credential_source)
@@ -1135,65 +1114,62 @@ class TestCredentials(object):
         with pytest.raises(exceptions.RefreshError) as excinfo:
             credentials.retrieve_subject_token(None)
 
-        assert excinfo.match(
-            "Unable to parse subject_token from JSON file '{}' using key '{}'".format(
-                str(invalid_json_file), "access_token"
-            )
-        )
+        assert (
+            "Unable to parse subject_token from JSON file "
+            f"'{invalid_json_subject_token_file}' using key 'access_token'"
+        ) in str(excinfo.value)
 
     def test_retrieve_subject_token_file_not_found(self):
         credential_source = {"file": "./not_found.txt"}
         credentials = self.make_credentials(credential_source=credential_source)
 
-        with pytest.raises(exceptions.RefreshError) as excinfo:
+        with pytest.raises(
+            exceptions.RefreshError, match=r"File './not_found.txt' was not found"
+        ):
             credentials.retrieve_subject_token(None)
 
-        assert excinfo.match(r"File './not_found.txt' was not found")
-
     def test_token_info_url(self):
-        credentials = self.make_credentials(
-            credential_source=self.CREDENTIAL_SOURCE_JSON
-        )
+        credentials = self.make_credentials(credential_source=CREDENTIAL_SOURCE_JSON)
 
         assert credentials.token_info_url == TOKEN_INFO_URL
 
-    def test_token_info_url_custom(self):
-        for url in VALID_TOKEN_URLS:
-            credentials = self.make_credentials(
-                credential_source=self.CREDENTIAL_SOURCE_JSON.copy(),
-                token_info_url=(url + "/introspect"),
-            )
+    @pytest.mark.parametrize("url", VALID_TOKEN_URLS)
+    def test_token_info_url_custom(self, url):
+        credentials = self.make_credentials(
+            credential_source=CREDENTIAL_SOURCE_JSON,
+            token_info_url=(url + "/introspect"),
+        )
 
-            assert credentials.token_info_url == url + "/introspect"
+        assert credentials.token_info_url == url + "/introspect"
 
     def test_token_info_url_negative(self):
         credentials = self.make_credentials(
-            credential_source=self.CREDENTIAL_SOURCE_JSON.copy(), token_info_url=None
+            credential_source=CREDENTIAL_SOURCE_JSON, token_info_url=None
         )
 
         assert not credentials.token_info_url
 
-    def test_token_url_custom(self):
-        for url in VALID_TOKEN_URLS:
-            credentials = self.make_credentials(
-                credential_source=self.CREDENTIAL_SOURCE_JSON.copy(),
-                token_url=(url + "/token"),
-            )
-
-            assert credentials._token_url == (url + "/token")
+    @pytest.mark.parametrize("url", VALID_TOKEN_URLS)
+    def test_token_url_custom(self, url):
+        credentials = self.make_credentials(
+            credential_source=CREDENTIAL_SOURCE_JSON,
+            token_url=(url + "/token"),
+        )
 
-    def test_service_account_impersonation_url_custom(self):
-        for url in VALID_SERVICE_ACCOUNT_IMPERSONATION_URLS:
-            credentials = self.make_credentials(
-                credential_source=self.CREDENTIAL_SOURCE_JSON.copy(),
-                service_account_impersonation_url=(
-                    url + SERVICE_ACCOUNT_IMPERSONATION_URL_ROUTE
-                ),
-            )
+        assert credentials._token_url == (url + "/token")
 
-            assert credentials._service_account_impersonation_url == (
+    @pytest.mark.parametrize("url", VALID_SERVICE_ACCOUNT_IMPERSONATION_URLS)
+    def test_service_account_impersonation_url_custom(self, url):
+        credentials = self.make_credentials(
+            credential_source=CREDENTIAL_SOURCE_JSON,
+            service_account_impersonation_url=(
                 url + SERVICE_ACCOUNT_IMPERSONATION_URL_ROUTE
-            )
+            ),
+        )
+
+        assert credentials._service_account_impersonation_url == (
+            url + SERVICE_ACCOUNT_IMPERSONATION_URL_ROUTE
+        )
 
     def test_refresh_text_file_success_without_impersonation_ignore_default_scopes(
         self,
@@ -1202,7 +1178,7 @@ class TestCredentials(object):
             client_id=CLIENT_ID,
             client_secret=CLIENT_SECRET,
             # Test with text format type.
-            credential_source=self.CREDENTIAL_SOURCE_TEXT,
+            credential_source=CREDENTIAL_SOURCE_TEXT,
             scopes=SCOPES,
             # Default scopes should be ignored.
             default_scopes=["ignored"],
@@ -1229,7 +1205,7 @@ class TestCredentials(object):
             client_id=CLIENT_ID,
             client_secret=CLIENT_SECRET,
             # Test with text format type.
-            credential_source=self.CREDENTIAL_SOURCE_TEXT,
+            credential_source=CREDENTIAL_SOURCE_TEXT,
             scopes=SCOPES,
             # This will be ignored in favor of client auth.
             workforce_pool_user_project=WORKFORCE_POOL_USER_PROJECT,
@@ -1256,7 +1232,7 @@ class TestCredentials(object):
             client_id=CLIENT_ID,
             client_secret=CLIENT_SECRET,
             # Test with text format type.
-            credential_source=self.CREDENTIAL_SOURCE_TEXT,
+            credential_source=CREDENTIAL_SOURCE_TEXT,
             scopes=SCOPES,
             # This is not needed when client Auth is used.
             workforce_pool_user_project=None,
@@ -1283,7 +1259,7 @@ class TestCredentials(object):
             client_id=None,
             client_secret=None,
             # Test with text format type.
-            credential_source=self.CREDENTIAL_SOURCE_TEXT,
+            credential_source=CREDENTIAL_SOURCE_TEXT,
             scopes=SCOPES,
             # This will not be ignored as client auth is not used.
             workforce_pool_user_project=WORKFORCE_POOL_USER_PROJECT,
@@ -1311,7 +1287,7 @@ class TestCredentials(object):
             client_secret=None,
             service_account_impersonation_url=SERVICE_ACCOUNT_IMPERSONATION_URL,
             # Test with text format type.
-            credential_source=self.CREDENTIAL_SOURCE_TEXT,
+            credential_source=CREDENTIAL_SOURCE_TEXT,
             scopes=SCOPES,
             # This will not be ignored as client auth is not used.
             workforce_pool_user_project=WORKFORCE_POOL_USER_PROJECT,
@@ -1336,7 +1312,7 @@ class TestCredentials(object):
             client_id=CLIENT_ID,
             client_secret=CLIENT_SECRET,
             # Test with text format type.
-            credential_source=self.CREDENTIAL_SOURCE_TEXT,
+            credential_source=CREDENTIAL_SOURCE_TEXT,
             scopes=None,
             # Default scopes should be used since user specified scopes are none.
             default_scopes=SCOPES,
@@ -1360,7 +1336,7 @@ class TestCredentials(object):
         # Initialize credentials with service account impersonation and basic auth.
         credentials = self.make_credentials(
             # Test with text format type.
-            credential_source=self.CREDENTIAL_SOURCE_TEXT,
+            credential_source=CREDENTIAL_SOURCE_TEXT,
             service_account_impersonation_url=SERVICE_ACCOUNT_IMPERSONATION_URL,
             scopes=SCOPES,
             # Default scopes should be ignored.
@@ -1386,7 +1362,7 @@ class TestCredentials(object):
         # and default scopes (no user scopes).
         credentials = self.make_credentials(
             # Test with text format type.
-            credential_source=self.CREDENTIAL_SOURCE_TEXT,
+            credential_source=CREDENTIAL_SOURCE_TEXT,
             service_account_impersonation_url=SERVICE_ACCOUNT_IMPERSONATION_URL,
             scopes=None,
             # Default scopes should be used since user specified scopes are none.
@@ -1412,7 +1388,7 @@ class TestCredentials(object):
             client_id=CLIENT_ID,
             client_secret=CLIENT_SECRET,
             # Test with JSON format type.
-            credential_source=self.CREDENTIAL_SOURCE_JSON,
+            credential_source=CREDENTIAL_SOURCE_JSON,
             scopes=SCOPES,
         )
 
@@ -1434,7 +1410,7 @@ class TestCredentials(object):
         # Initialize credentials with service account impersonation and basic auth.
         credentials = self.make_credentials(
             # Test with JSON format type.
-            credential_source=self.CREDENTIAL_SOURCE_JSON,
+            credential_source=CREDENTIAL_SOURCE_JSON,
             service_account_impersonation_url=SERVICE_ACCOUNT_IMPERSONATION_URL,
             scopes=SCOPES,
         )
@@ -1463,15 +1439,11 @@ class TestCredentials(object):
         with pytest.raises(exceptions.RefreshError) as excinfo:
             credentials.refresh(None)
 
-        assert excinfo.match(
-            "Unable to parse subject_token from JSON file '{}' using key '{}'".format(
-                SUBJECT_TOKEN_JSON_FILE, "not_found"
-            )
-        )
+        assert JSON_FILE_SUBJECT_TOKEN_NOT_FOUND_ERROR in str(excinfo.value)
 
     def test_retrieve_subject_token_from_url(self):
         credentials = self.make_credentials(
-            credential_source=self.CREDENTIAL_SOURCE_TEXT_URL
+            credential_source=CREDENTIAL_SOURCE_TEXT_URL
         )
         request = self.make_mock_request(token_data=TEXT_FILE_SUBJECT_TOKEN)
         subject_token = credentials.retrieve_subject_token(request)
@@ -1481,7 +1453,7 @@ class TestCredentials(object):
 
     def test_retrieve_subject_token_from_url_with_headers(self):
         credentials = self.make_credentials(
-            credential_source={"url": self.CREDENTIAL_URL, "headers": {"foo": "bar"}}
+            credential_source={"url": CREDENTIAL_URL, "headers": {"foo": "bar"}}
         )
         request = self.make_mock_request(token_data=TEXT_FILE_SUBJECT_TOKEN)
         subject_token = credentials.retrieve_subject_token(request)
@@ -1493,9 +1465,9 @@ class TestCredentials(object):
 
     def test_retrieve_subject_token_from_url_json(self):
         credentials = self.make_credentials(
-            credential_source=self.CREDENTIAL_SOURCE_JSON_URL
+            credential_source=CREDENTIAL_SOURCE_JSON_URL
         )
-        request = self.make_mock_request(token_data=JSON_FILE_CONTENT)
+        request = self.make_mock_request(token_data=JSON_FILE_CONTENT_BYTES)
         subject_token = credentials.retrieve_subject_token(request)
 
         assert subject_token == JSON_FILE_SUBJECT_TOKEN
@@ -1504,12 +1476,12 @@ class TestCredentials(object):
     def test_retrieve_subject_token_from_url_json_with_headers(self):
         credentials = self.make_credentials(
             credential_source={
-                "url": self.CREDENTIAL_URL,
+                "url": CREDENTIAL_URL,
                 "format": {"type": "json", "subject_token_field_name": "access_token"},
                 "headers": {"foo": "bar"},
             }
         )
-        request = self.make_mock_request(token_data=JSON_FILE_CONTENT)
+        request = self.make_mock_request(token_data=JSON_FILE_CONTENT_BYTES)
         subject_token = credentials.retrieve_subject_token(request)
 
         assert subject_token == JSON_FILE_SUBJECT_TOKEN
@@ -1519,163 +1491,123 @@ class TestCredentials(object):
 
     def test_retrieve_subject_token_from_url_not_found(self):
         credentials = self.make_credentials(
-            credential_source=self.CREDENTIAL_SOURCE_TEXT_URL
+            credential_source=CREDENTIAL_SOURCE_TEXT_URL
         )
         with pytest.raises(exceptions.RefreshError) as excinfo:
             credentials.retrieve_subject_token(
-                self.make_mock_request(token_status=404, token_data=JSON_FILE_CONTENT)
+                self.make_mock_request(
+                    token_status=404, token_data=JSON_FILE_CONTENT_BYTES
+                )
             )
 
-        assert excinfo.match("Unable to retrieve Identity Pool subject token")
+        assert "Unable to retrieve Identity Pool subject token" in str(excinfo.value)
 
     def test_retrieve_subject_token_from_url_json_invalid_field(self):
         credential_source = {
-            "url": self.CREDENTIAL_URL,
+            "url": CREDENTIAL_URL,
             "format": {"type": "json", "subject_token_field_name": "not_found"},
         }
         credentials = self.make_credentials(credential_source=credential_source)
 
         with pytest.raises(exceptions.RefreshError) as excinfo:
             credentials.retrieve_subject_token(
-                self.make_mock_request(token_data=JSON_FILE_CONTENT)
+                self.make_mock_request(token_data=JSON_FILE_CONTENT_BYTES)
             )
 
-        assert excinfo.match(
-            "Unable to parse subject_token from JSON file '{}' using key '{}'".format(
-                self.CREDENTIAL_URL, "not_found"
-            )
-        )
+        assert URL_SUBJECT_TOKEN_NOT_FOUND_ERROR in str(excinfo.value)
 
     def test_retrieve_subject_token_from_url_json_invalid_format(self):
         credentials = self.make_credentials(
-            credential_source=self.CREDENTIAL_SOURCE_JSON_URL
+            credential_source=CREDENTIAL_SOURCE_JSON_URL
         )
 
         with pytest.raises(exceptions.RefreshError) as excinfo:
             credentials.retrieve_subject_token(self.make_mock_request(token_data="{"))
 
-        assert excinfo.match(
-            "Unable to parse subject_token from JSON file '{}' using key '{}'".format(
-                self.CREDENTIAL_URL, "access_token"
-            )
-        )
-
-    def test_refresh_text_file_success_without_impersonation_url(self):
-        credentials = self.make_credentials(
-            client_id=CLIENT_ID,
-            client_secret=CLIENT_SECRET,
-            # Test with text format type.
-            credential_source=self.CREDENTIAL_SOURCE_TEXT_URL,
-            scopes=SCOPES,
-        )
-
-        self.assert_underlying_credentials_refresh(
-            credentials=credentials,
-            audience=AUDIENCE,
-            subject_token=TEXT_FILE_SUBJECT_TOKEN,
-            subject_token_type=SUBJECT_TOKEN_TYPE,
-            token_url=TOKEN_URL,
-            service_account_impersonation_url=None,
-            basic_auth_encoding=BASIC_AUTH_ENCODING,
-            quota_project_id=None,
-            used_scopes=SCOPES,
-            scopes=SCOPES,
-            default_scopes=None,
-            credential_data=TEXT_FILE_SUBJECT_TOKEN,
-        )
-
-    def test_refresh_text_file_success_with_impersonation_url(self):
-        # Initialize credentials with service account impersonation and basic auth.
-        credentials = self.make_credentials(
-            # Test with text format type.
-            credential_source=self.CREDENTIAL_SOURCE_TEXT_URL,
-            service_account_impersonation_url=SERVICE_ACCOUNT_IMPERSONATION_URL,
-            scopes=SCOPES,
-        )
-
-        self.assert_underlying_credentials_refresh(
-            credentials=credentials,
-            audience=AUDIENCE,
-            subject_token=TEXT_FILE_SUBJECT_TOKEN,
-            subject_token_type=SUBJECT_TOKEN_TYPE,
-            token_url=TOKEN_URL,
-            service_account_impersonation_url=SERVICE_ACCOUNT_IMPERSONATION_URL,
-            basic_auth_encoding=None,
-            quota_project_id=None,
-            used_scopes=SCOPES,
-            scopes=SCOPES,
-            default_scopes=None,
-            credential_data=TEXT_FILE_SUBJECT_TOKEN,
-        )
-
-    def test_refresh_json_file_success_without_impersonation_url(self):
-        credentials = self.make_credentials(
-            client_id=CLIENT_ID,
-            client_secret=CLIENT_SECRET,
-            # Test with JSON format type.
-            credential_source=self.CREDENTIAL_SOURCE_JSON_URL,
-            scopes=SCOPES,
-        )
-
-        self.assert_underlying_credentials_refresh(
-            credentials=credentials,
-            audience=AUDIENCE,
-            subject_token=JSON_FILE_SUBJECT_TOKEN,
-            subject_token_type=SUBJECT_TOKEN_TYPE,
-            token_url=TOKEN_URL,
-            service_account_impersonation_url=None,
-            basic_auth_encoding=BASIC_AUTH_ENCODING,
-            quota_project_id=None,
-            used_scopes=SCOPES,
-            scopes=SCOPES,
-            default_scopes=None,
-            credential_data=JSON_FILE_CONTENT,
-        )
+        assert URL_SUBJECT_TOKEN_INVALID_JSON_ERROR in str(excinfo.value)
 
-    def test_refresh_json_file_success_with_impersonation_url(self):
-        # Initialize credentials with service account impersonation and basic auth.
+    @pytest.mark.parametrize(
+        "credential_source,subject_token,credential_data",
+        [
+            pytest.param(
+                CREDENTIAL_SOURCE_TEXT_URL,
+                TEXT_FILE_SUBJECT_TOKEN,
+                TEXT_FILE_SUBJECT_TOKEN,
+                id="text_file",
+            ),
+            pytest.param(
+                CREDENTIAL_SOURCE_JSON_URL,
+                JSON_FILE_SUBJECT_TOKEN,
+                JSON_FILE_CONTENT_BYTES,
+                id="json_file",
+            ),
+        ],
+    )
+    @pytest.mark.parametrize(
+        "service_account_impersonation_url,client_auth,basic_auth_encoding",
+        [
+            pytest.param(
+                None,
+                {"client_id": CLIENT_ID, "client_secret": CLIENT_SECRET},
+                BASIC_AUTH_ENCODING,
+                id="without_impersonation_url",
+            ),
+            # Service account impersonation is exercised without basic auth.
+            pytest.param(
+                SERVICE_ACCOUNT_IMPERSONATION_URL,
+                {},
+                None,
+                id="with_impersonation_url",
+            ),
+        ],
+    )
+    def test_refresh_url_success(
+        self,
+        credential_source,
+        subject_token,
+        credential_data,
+        service_account_impersonation_url,
+        client_auth,
+        basic_auth_encoding,
+    ):
         credentials = self.make_credentials(
-            # Test with JSON format type.
-            credential_source=self.CREDENTIAL_SOURCE_JSON_URL,
-            service_account_impersonation_url=SERVICE_ACCOUNT_IMPERSONATION_URL,
+            credential_source=credential_source,
+            service_account_impersonation_url=service_account_impersonation_url,
             scopes=SCOPES,
+            **client_auth,
         )
 
         self.assert_underlying_credentials_refresh(
             credentials=credentials,
             audience=AUDIENCE,
-            subject_token=JSON_FILE_SUBJECT_TOKEN,
+            subject_token=subject_token,
             subject_token_type=SUBJECT_TOKEN_TYPE,
             token_url=TOKEN_URL,
-            service_account_impersonation_url=SERVICE_ACCOUNT_IMPERSONATION_URL,
-            basic_auth_encoding=None,
+            service_account_impersonation_url=service_account_impersonation_url,
+            basic_auth_encoding=basic_auth_encoding,
             quota_project_id=None,
             used_scopes=SCOPES,
             scopes=SCOPES,
             default_scopes=None,
-            credential_data=JSON_FILE_CONTENT,
+            credential_data=credential_data,
         )
 
     def test_refresh_with_retrieve_subject_token_error_url(self):
         credential_source = {
-            "url": self.CREDENTIAL_URL,
+            "url": CREDENTIAL_URL,
             "format": {"type": "json", "subject_token_field_name": "not_found"},
         }
         credentials = self.make_credentials(credential_source=credential_source)
 
         with pytest.raises(exceptions.RefreshError) as excinfo:
-            credentials.refresh(self.make_mock_request(token_data=JSON_FILE_CONTENT))
-
-        assert excinfo.match(
-            "Unable to parse subject_token from JSON file '{}' using key '{}'".format(
-                self.CREDENTIAL_URL, "not_found"
+            credentials.refresh(
+                self.make_mock_request(token_data=JSON_FILE_CONTENT_BYTES)
             )
-        )
 
-    def test_retrieve_subject_token_supplier(self):
-        supplier = TestSubjectTokenSupplier(subject_token=JSON_FILE_SUBJECT_TOKEN)
+        assert URL_SUBJECT_TOKEN_NOT_FOUND_ERROR in str(excinfo.value)
 
-        credentials = self.make_credentials(subject_token_supplier=supplier)
+    def test_retrieve_subject_token_supplier(self, json_supplier):
+        credentials = self.make_credentials(subject_token_supplier=json_supplier)
 
         subject_token = credentials.retrieve_subject_token(None)
 
@@ -1700,38 +1632,26 @@ class TestCredentials(object):
         credentials = self.make_credentials(subject_token_supplier=supplier)
 
         with pytest.raises(exceptions.RefreshError) as excinfo:
-            credentials.refresh(self.make_mock_request(token_data=JSON_FILE_CONTENT))
+            credentials.retrieve_subject_token(None)
 
-        assert excinfo.match("test error")
+        assert "test error" in str(excinfo.value)
 
-    def test_refresh_success_supplier_with_impersonation_url(self):
-        # Initialize credentials with service account impersonation and a supplier.
-        supplier = TestSubjectTokenSupplier(subject_token=JSON_FILE_SUBJECT_TOKEN)
+    @pytest.mark.parametrize(
+        "service_account_impersonation_url",
+        [
+            pytest.param(
+                SERVICE_ACCOUNT_IMPERSONATION_URL, id="with_impersonation_url"
+            ),
+            pytest.param(None, id="without_impersonation_url"),
+        ],
+    )
+    def test_refresh_success_supplier(
+        self, json_supplier, service_account_impersonation_url
+    ):
         credentials = self.make_credentials(
-            subject_token_supplier=supplier,
-            service_account_impersonation_url=SERVICE_ACCOUNT_IMPERSONATION_URL,
-            scopes=SCOPES,
-        )
-
-        self.assert_underlying_credentials_refresh(
-            credentials=credentials,
-            audience=AUDIENCE,
-            subject_token=TEXT_FILE_SUBJECT_TOKEN,
-            subject_token_type=SUBJECT_TOKEN_TYPE,
-            token_url=TOKEN_URL,
-            service_account_impersonation_url=SERVICE_ACCOUNT_IMPERSONATION_URL,
-            basic_auth_encoding=None,
-            quota_project_id=None,
-            used_scopes=SCOPES,
+            subject_token_supplier=json_supplier,
+            service_account_impersonation_url=service_account_impersonation_url,
             scopes=SCOPES,
-            default_scopes=None,
-        )
-
-    def test_refresh_success_supplier_without_impersonation_url(self):
-        # Initialize supplier credentials without service account impersonation.
-        supplier = TestSubjectTokenSupplier(subject_token=JSON_FILE_SUBJECT_TOKEN)
-        credentials = self.make_credentials(
-            subject_token_supplier=supplier, scopes=SCOPES
         )
 
         self.assert_underlying_credentials_refresh(
@@ -1740,6 +1660,7 @@ class TestCredentials(object):
             subject_token=TEXT_FILE_SUBJECT_TOKEN,
             subject_token_type=SUBJECT_TOKEN_TYPE,
             token_url=TOKEN_URL,
+            service_account_impersonation_url=service_account_impersonation_url,
             basic_auth_encoding=None,
             quota_project_id=None,
             used_scopes=SCOPES,
@@ -1747,30 +1668,22 @@ class TestCredentials(object):
             default_scopes=None,
         )
 
-    @mock.patch(
-        "google.auth.transport._mtls_helper._get_workload_cert_and_key_paths",
-        return_value=("cert", "key"),
-    )
-    def test_get_mtls_certs(self, mock_get_workload_cert_and_key_paths):
+    def test_get_mtls_certs(self, mock_cert_paths):
         credentials = self.make_credentials(
-            credential_source=self.CREDENTIAL_SOURCE_CERTIFICATE.copy()
+            credential_source=CREDENTIAL_SOURCE_CERTIFICATE
         )
 
         cert, key = credentials._get_mtls_cert_and_key_paths()
-        assert cert == "cert"
-        assert key == "key"
+        assert cert == CERT_FILE
+        assert key == KEY_FILE
 
     def test_get_mtls_certs_invalid(self):
-        credentials = self.make_credentials(
-            credential_source=self.CREDENTIAL_SOURCE_TEXT.copy()
-        )
+        credentials = self.make_credentials(credential_source=CREDENTIAL_SOURCE_TEXT)
 
         with pytest.raises(exceptions.RefreshError) as excinfo:
             credentials._get_mtls_cert_and_key_paths()
 
-        assert excinfo.match(
-            'The credential is not configured to use mtls requests. The credential should include a "certificate" section in the credential source.'
-        )
+        assert MTLS_NOT_CONFIGURED_ERROR in str(excinfo.value)
 
     @mock.patch("google.auth._agent_identity_utils.parse_certificate")
     @mock.patch(
@@ -1795,7 +1708,7 @@ class TestCredentials(object):
     ):
         mock_parse_certificate.return_value = mock.sentinel.cert
         credentials = self.make_credentials(
-            credential_source=self.CREDENTIAL_SOURCE_CERTIFICATE.copy()
+            credential_source=CREDENTIAL_SOURCE_CERTIFICATE
         )
         credentials.refresh(None)
         mock_parse_certificate.assert_called_once_with(b"cert")
@@ -1821,7 +1734,7 @@ class TestCredentials(object):
     ):
         mock_parse_certificate.return_value = mock.sentinel.cert
         credentials = self.make_credentials(
-            credential_source=self.CREDENTIAL_SOURCE_CERTIFICATE.copy()
+            credential_source=CREDENTIAL_SOURCE_CERTIFICATE
         )
         credentials.refresh(None)
         mock_parse_certificate.assert_called_once_with(b"cert")